@@ -1,9 +1,12 @@
 from datetime import date
 
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, HTTPException, Query
+from pydantic import ValidationError
 
+from app.core.settings import settings
+from app.models.connection_rules import MAX_RULE_MINUTES
 from app.schemas import JourneySearchResponse
-from app.services.events_provider import get_flight_events
+from app.services.events_provider import get_timetable
 from app.services.journey_search import JourneySearchService
 
 router = APIRouter()
@@ -33,7 +36,35 @@ def search_journeys(
         max_length=3,
         description="Destination city code (3-letter IATA)",
     ),
+    min_connection_minutes: int | None = Query(
+        None,
+        ge=0,
+        le=MAX_RULE_MINUTES,
+        description="Minimum connection time in minutes, at every airport",
+    ),
+    max_connection_minutes: int | None = Query(
+        None,
+        ge=0,
+        le=MAX_RULE_MINUTES,
+        description="Maximum connection time in minutes, at every airport",
+    ),
+    max_journey_duration_minutes: int | None = Query(
+        None,
+        gt=0,
+        le=MAX_RULE_MINUTES,
+        description="Maximum total journey duration in minutes, at every airport",
+    ),
 ) -> JourneySearchResponse:
-    service = JourneySearchService()
-    events = get_flight_events()
-    return service.search(date_param, from_code, to_code, events)
+    try:
+        rules = settings.connection_rules.with_overrides(
+            min_connection_minutes=min_connection_minutes,
+            max_connection_minutes=max_connection_minutes,
+            max_journey_duration_minutes=max_journey_duration_minutes,
+        )
+    except ValidationError as exc:
+        raise HTTPException(
+            status_code=422,
+            detail=exc.errors(include_url=False, include_context=False),
+        )
+    service = JourneySearchService(rules)
+    return service.search(date_param, from_code, to_code, get_timetable())
@@ -1,5 +1,14 @@
+from datetime import date
+from typing import Literal
+
+from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+from app.models.connection_rules import ConnectionRules
+
+# Number of distinct 3-letter city codes.
+MAX_SYNTHETIC_CITIES = 26**3
+
 
 class Settings(BaseSettings):
 
@@ -11,6 +20,23 @@ class Settings(BaseSettings):
 
     app_name: str = "Journey Search API"
     environment: str = "local"
+    connection_rules: ConnectionRules = Field(
+        default_factory=ConnectionRules,
+        description="Default journey rules, including per-airport overrides (JSON in env)",
+    )
+
+    # Flight events source: the fixed sample or a generated synthetic timetable
+    # (used for load testing).
+    events_source: Literal["sample", "synthetic"] = "sample"
+    synthetic_city_count: int = Field(default=30, ge=2, le=MAX_SYNTHETIC_CITIES)
+    synthetic_flights_per_day: int = Field(default=500, ge=1)
+    synthetic_days: int = Field(default=3, ge=1)
+    synthetic_start_date: date = date(2026, 9, 12)
+    synthetic_seed: int = 0
+
+    # Cap on flight events kept in memory by the date-partitioned timetable.
+    # None keeps every loaded date.
+    timetable_max_events: int | None = Field(default=200_000, ge=1)
 
 
 settings: Settings = Settings()
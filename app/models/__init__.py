@@ -1,3 +1,4 @@
+from app.models.connection_rules import AirportConnectionRules, ConnectionRules
 from app.models.flight_event import FlightEvent
 
-__all__ = ["FlightEvent"]
+__all__ = ["AirportConnectionRules", "ConnectionRules", "FlightEvent"]
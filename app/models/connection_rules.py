@@ -0,0 +1,180 @@
+from datetime import timedelta
+
+from pydantic import BaseModel, Field, field_validator, model_validator
+
+DEFAULT_MIN_CONNECTION_MINUTES = 0
+DEFAULT_MAX_CONNECTION_MINUTES = 4 * 60
+DEFAULT_MAX_JOURNEY_DURATION_MINUTES = 24 * 60
+# Upper bound for every minute value, keeping time windows (and the dates a
+# search has to load) within a few days.
+MAX_RULE_MINUTES = 3 * 24 * 60
+
+# How a request value combines with an airport override: always the stricter.
+_STRICTER = {
+    "min_connection_minutes": max,
+    "max_connection_minutes": min,
+    "max_journey_duration_minutes": min,
+}
+
+
+class AirportConnectionRules(BaseModel):
+    """
+    Per-airport override of the connection rules.
+
+    Only the fields that are set replace the base rules when a journey
+    connects at this airport.
+    """
+
+    min_connection_minutes: int | None = Field(
+        default=None,
+        ge=0,
+        le=MAX_RULE_MINUTES,
+        description="Minimum connection time (MCT) at this airport, in minutes",
+    )
+    max_connection_minutes: int | None = Field(
+        default=None,
+        ge=0,
+        le=MAX_RULE_MINUTES,
+        description="Maximum connection time at this airport, in minutes",
+    )
+    max_journey_duration_minutes: int | None = Field(
+        default=None,
+        gt=0,
+        le=MAX_RULE_MINUTES,
+        description="Maximum total journey duration when connecting here, in minutes",
+    )
+
+    model_config = {"frozen": True}
+
+
+class ConnectionRules(BaseModel):
+    """
+    Rules a journey must satisfy: connection window and total duration.
+
+    The base values apply everywhere; entries in ``airport_overrides``
+    replace them for journeys connecting at that airport.
+    """
+
+    min_connection_minutes: int = Field(
+        default=DEFAULT_MIN_CONNECTION_MINUTES,
+        ge=0,
+        le=MAX_RULE_MINUTES,
+        description="Minimum connection time, in minutes",
+    )
+    max_connection_minutes: int = Field(
+        default=DEFAULT_MAX_CONNECTION_MINUTES,
+        ge=0,
+        le=MAX_RULE_MINUTES,
+        description="Maximum connection time, in minutes",
+    )
+    max_journey_duration_minutes: int = Field(
+        default=DEFAULT_MAX_JOURNEY_DURATION_MINUTES,
+        gt=0,
+        le=MAX_RULE_MINUTES,
+        description="Maximum total journey duration (first departure to last arrival), in minutes",
+    )
+    airport_overrides: dict[str, AirportConnectionRules] = Field(
+        default_factory=dict,
+        description="Overrides keyed by connecting airport code (3-letter IATA)",
+    )
+
+    @field_validator("airport_overrides")
+    @classmethod
+    def normalize_airport_codes(
+        cls, value: dict[str, AirportConnectionRules]
+    ) -> dict[str, AirportConnectionRules]:
+        """Normalize override keys to upper-case airport codes."""
+        return {code.strip().upper(): rules for code, rules in value.items()}
+
+    @model_validator(mode="after")
+    def validate_connection_window(self) -> "ConnectionRules":
+        """
+        Ensure the base connection window is non-empty.
+
+        Airport windows are not checked here: an override combined with the
+        base values may leave an empty window, which only means no connection
+        is possible at that airport.
+        """
+        if self.min_connection_minutes > self.max_connection_minutes:
+            raise ValueError(
+                "min_connection_minutes must not exceed max_connection_minutes"
+            )
+        return self
+
+    @property
+    def has_connection_window(self) -> bool:
+        return self.min_connection_minutes <= self.max_connection_minutes
+
+    @property
+    def min_connection(self) -> timedelta:
+        return timedelta(minutes=self.min_connection_minutes)
+
+    @property
+    def max_connection(self) -> timedelta:
+        return timedelta(minutes=self.max_connection_minutes)
+
+    @property
+    def max_journey_duration(self) -> timedelta:
+        return timedelta(minutes=self.max_journey_duration_minutes)
+
+    @property
+    def longest_journey_duration(self) -> timedelta:
+        """Largest max journey duration across the base rules and all overrides."""
+        minutes = max(
+            [self.max_journey_duration_minutes]
+            + [
+                o.max_journey_duration_minutes
+                for o in self.airport_overrides.values()
+                if o.max_journey_duration_minutes is not None
+            ]
+        )
+        return timedelta(minutes=minutes)
+
+    def for_airport(self, airport: str | None) -> "ConnectionRules":
+        """Return the rules in effect for a journey connecting at ``airport``."""
+        override = self.airport_overrides.get(airport) if airport else None
+        if override is None:
+            if not self.airport_overrides:
+                return self
+            return self.model_copy(update={"airport_overrides": {}})
+        update = override.model_dump(exclude_none=True)
+        update["airport_overrides"] = {}
+        return self.model_copy(update=update)
+
+    def with_overrides(self, **overrides: int | None) -> "ConnectionRules":
+        """
+        Return a copy with the given values applied at every airport.
+
+        The values replace the base rules. At airports with an override they
+        can only narrow the rules: the airport minimum connection time stays a
+        floor, and its maximum connection time and journey duration stay
+        ceilings. ``None`` values are ignored so optional request parameters
+        can be passed straight through. The result is re-validated.
+        """
+        update = {key: value for key, value in overrides.items() if value is not None}
+        if not update:
+            return self
+        airport_overrides = {}
+        for code, override in self.airport_overrides.items():
+            fields = override.model_dump(exclude_none=True)
+            for key, value in update.items():
+                if key in fields:
+                    fields[key] = _STRICTER[key](fields[key], value)
+            airport_overrides[code] = fields
+        return ConnectionRules.model_validate(
+            {**self.model_dump(), **update, "airport_overrides": airport_overrides}
+        )
+
+    model_config = {
+        "frozen": True,
+        "json_schema_extra": {
+            "example": {
+                "min_connection_minutes": 0,
+                "max_connection_minutes": 240,
+                "max_journey_duration_minutes": 1440,
+                "airport_overrides": {
+                    "MAD": {"min_connection_minutes": 45},
+                },
+            }
+        },
+    }
@@ -8,7 +8,12 @@ def _serialize_datetime(dt: datetime) -> str:
 
 
 class FlightPathSegment(BaseModel):
-    """Single flight segment in a journey."""
+    """
+    Single flight segment in a journey.
+
+    Immutable, since the search shares one instance between every journey
+    that contains the same flight.
+    """
 
     flight_number: str = Field(description="Flight number")
     from_: str = Field(
@@ -38,6 +43,7 @@ class FlightPathSegment(BaseModel):
         return _serialize_datetime(dt)
 
     model_config = {
+        "frozen": True,
         "populate_by_name": True,
         "json_schema_extra": {
             "example": {
@@ -1,16 +1,118 @@
-from datetime import datetime, timezone
+import random
+from datetime import date, datetime, time, timedelta, timezone
+from functools import lru_cache
+from string import ascii_uppercase
 
+from app.core.settings import MAX_SYNTHETIC_CITIES, settings
 from app.models.flight_event import FlightEvent
+from app.services.timetable import PartitionedTimetable
 
 
-def get_flight_events() -> list[FlightEvent]:
+def get_flight_events_for_date(day: date) -> list[FlightEvent]:
     """
-    Return flight events for the given date.
+    Return the flight events departing on ``day`` (UTC).
 
-    This simulates an external Flight Events API.
-    The data is deterministic and suitable for local development and testing.
+    This simulates a per-date query against an external Flight Events API and
+    is used to load timetable partitions lazily. The data is deterministic and
+    suitable for local development and testing. With
+    ``events_source="synthetic"`` a generated timetable sized by the
+    ``synthetic_*`` settings is used instead of the fixed sample.
     """
+    if settings.events_source == "synthetic":
+        offset = (day - settings.synthetic_start_date).days
+        if not 0 <= offset < settings.synthetic_days:
+            return []
+        return generate_synthetic_day(
+            city_count=settings.synthetic_city_count,
+            flights_per_day=settings.synthetic_flights_per_day,
+            day=offset,
+            start_date=settings.synthetic_start_date,
+            seed=settings.synthetic_seed,
+        )
+    return [e for e in _sample_events() if e.departure_datetime.date() == day]
 
+
+@lru_cache(maxsize=1)
+def get_timetable() -> PartitionedTimetable:
+    """Return the process-wide date-partitioned timetable."""
+    return PartitionedTimetable(
+        get_flight_events_for_date,
+        max_events=settings.timetable_max_events,
+    )
+
+
+def synthetic_city_codes(count: int) -> list[str]:
+    """Return ``count`` distinct 3-letter city codes (AAA, AAB, ...)."""
+    if count > MAX_SYNTHETIC_CITIES:
+        raise ValueError(f"At most {MAX_SYNTHETIC_CITIES} distinct city codes exist")
+    codes = []
+    for i in range(count):
+        first, rest = divmod(i, 26 * 26)
+        second, third = divmod(rest, 26)
+        codes.append(
+            ascii_uppercase[first] + ascii_uppercase[second] + ascii_uppercase[third]
+        )
+    return codes
+
+
+def generate_synthetic_events(
+    city_count: int,
+    flights_per_day: int,
+    days: int,
+    start_date: date,
+    seed: int = 0,
+) -> list[FlightEvent]:
+    """Generate a deterministic synthetic timetable of ``days`` consecutive dates."""
+    return [
+        event
+        for day in range(days)
+        for event in generate_synthetic_day(
+            city_count, flights_per_day, day, start_date, seed
+        )
+    ]
+
+
+def generate_synthetic_day(
+    city_count: int,
+    flights_per_day: int,
+    day: int,
+    start_date: date,
+    seed: int = 0,
+) -> list[FlightEvent]:
+    """
+    Generate the synthetic flights departing ``day`` days after ``start_date``.
+
+    Each date has its own seeded generator, so a single date can be produced
+    without generating the ones before it. Cities are picked with a Zipf-like
+    skew so the first codes behave like hubs. Flights depart at a random
+    minute of the day and last 1 to 12 hours.
+    """
+    rng = random.Random(f"{seed}:{day}")
+    cities = synthetic_city_codes(city_count)
+    weights = [1 / (rank + 1) for rank in range(city_count)]
+    day_start = datetime.combine(
+        start_date + timedelta(days=day), time.min, tzinfo=timezone.utc
+    )
+    events: list[FlightEvent] = []
+    for n in range(flights_per_day):
+        departure_city, arrival_city = rng.choices(cities, weights=weights, k=2)
+        while arrival_city == departure_city:
+            arrival_city = rng.choices(cities, weights=weights)[0]
+        departure = day_start + timedelta(minutes=rng.randrange(24 * 60))
+        arrival = departure + timedelta(minutes=rng.randrange(60, 12 * 60))
+        events.append(
+            FlightEvent(
+                flight_number=f"SY{day:03d}{n:05d}",
+                departure_city=departure_city,
+                arrival_city=arrival_city,
+                departure_datetime=departure,
+                arrival_datetime=arrival,
+            )
+        )
+    return events
+
+
+def _sample_events() -> list[FlightEvent]:
     return [
         # --- Direct flight BUE -> MAD ---
         FlightEvent(
@@ -1,50 +1,71 @@
-from datetime import date, datetime, timedelta
+from datetime import date, datetime, time, timedelta, timezone
 
+from app.models.connection_rules import ConnectionRules
 from app.models.flight_event import FlightEvent
-from app.schemas.journey import FlightPathSegment, JourneySearchResult
+from app.schemas.journey import JourneySearchResult
+from app.services.timetable import EventIndex, IndexedEvent, PartitionedTimetable
 
-MAX_JOURNEY_DURATION_HOURS = 24
-MAX_CONNECTION_HOURS = 4
 
+_LATEST_DATETIME = datetime.max.replace(tzinfo=timezone.utc)
 
-def _event_to_segment(event: FlightEvent) -> FlightPathSegment:
-    """Map a FlightEvent to a FlightPathSegment schema."""
-    return FlightPathSegment(
-        flight_number=event.flight_number,
-        from_=event.departure_city,
-        to=event.arrival_city,
-        departure_time=event.departure_datetime,
-        arrival_time=event.arrival_datetime,
-    )
 
+def _shift(moment: datetime, delta: timedelta) -> datetime:
+    """Return ``moment + delta``, clamped to the latest representable datetime."""
+    try:
+        return moment + delta
+    except OverflowError:
+        return _LATEST_DATETIME
 
-def _total_duration_within_limit(
-    first_departure: datetime,
-    last_arrival: datetime,
-) -> bool:
-    """Return True if journey duration (first departure to last arrival) is <= 24 hours."""
-    delta = last_arrival - first_departure
-    return delta <= timedelta(hours=MAX_JOURNEY_DURATION_HOURS)
 
+class _IndexSet:
+    """Queries a date-ordered list of event indexes as a single index."""
 
-def _connection_within_limit(
-    first_arrival: datetime,
-    second_departure: datetime,
-) -> bool:
-    """Return True if connection time between flights is <= 4 hours."""
-    delta = second_departure - first_arrival
-    return timedelta(0) <= delta <= timedelta(hours=MAX_CONNECTION_HOURS)
+    def __init__(self, indexes: list[EventIndex]) -> None:
+        self._indexes = indexes
+
+    def departing(
+        self,
+        origin: str,
+        start: datetime,
+        end: datetime,
+    ) -> list[IndexedEvent]:
+        return [
+            event
+            for index in self._indexes
+            for event in index.departing(origin, start, end)
+        ]
+
+    def route(
+        self,
+        origin: str,
+        destination: str,
+        start: datetime,
+        end: datetime,
+        *,
+        include_start: bool = True,
+    ) -> list[IndexedEvent]:
+        return [
+            event
+            for index in self._indexes
+            for event in index.route(
+                origin, destination, start, end, include_start=include_start
+            )
+        ]
 
 
 class JourneySearchService:
     """Service that finds valid journeys from flight events."""
 
+    def __init__(self, rules: ConnectionRules | None = None) -> None:
+        self.rules = rules or ConnectionRules()
+
     def search(
         self,
         date: date,
         origin: str,
         destination: str,
-        events: list[FlightEvent],
+        events: list[FlightEvent] | PartitionedTimetable,
+        rules: ConnectionRules | None = None,
     ) -> list[JourneySearchResult]:
         """
         Find all journeys from origin to destination departing on the given date.
@@ -55,69 +76,87 @@ class JourneySearchService:
         - Journey is 1 or 2 flight events.
         - First flight departs on the given date (UTC).
         - Cities connect (for 2 legs: first arrival_city == second departure_city).
-        - Total duration (first departure to last arrival) <= 24 hours.
-        - Connection time between two flights <= 4 hours.
+        - Total duration (first departure to last arrival) <= max journey duration.
+        - Connection time between two flights is within the connection window
+          of the connecting airport (an empty window allows no connection there).
+
+        ``rules`` overrides the service rules for this search only. The rules
+        are compiled into departure-time windows on the event index, so only
+        candidates inside the allowed window are ever visited.
+
+        ``events`` is either a plain event list or a PartitionedTimetable; in
+        the latter case only the partitions for the departure date and the
+        following dates reachable within the journey duration are loaded.
+
+        Segments are shared: a flight appearing in several journeys is
+        represented by the same immutable FlightPathSegment in each of them.
 
         Returns a list of JourneySearchResult (schemas), not persistence models.
         """
+        rules = rules or self.rules
         origin = origin.strip().upper()
         destination = destination.strip().upper()
         results: list[JourneySearchResult] = []
         seen: set[tuple[str, ...]] = set()
 
+        day_start = datetime.combine(date, time.min, tzinfo=timezone.utc)
+        day_end = datetime.combine(date, time.max, tzinfo=timezone.utc)
+        if isinstance(events, PartitionedTimetable):
+            last_day = _shift(day_end, rules.longest_journey_duration).date()
+            index = _IndexSet(events.partitions(date, last_day))
+        else:
+            index = _IndexSet([EventIndex(events)])
+
         # Direct flights (1 leg)
-        for event in events:
-            if (
-                event.departure_city == origin
-                and event.arrival_city == destination
-                and event.departure_datetime.date() == date
-            ):
-                if _total_duration_within_limit(
-                    event.departure_datetime,
-                    event.arrival_datetime,
-                ):
-                    key = (event.flight_number,)
-                    if key not in seen:
-                        seen.add(key)
-                        segment = _event_to_segment(event)
-                        results.append(
-                            JourneySearchResult(connections=1, path=[segment])
-                        )
+        for event in index.route(origin, destination, day_start, day_end):
+            duration = event.arrival_datetime - event.departure_datetime
+            if duration > rules.max_journey_duration:
+                continue
+            key = (event.flight_number,)
+            if key not in seen:
+                seen.add(key)
+                results.append(JourneySearchResult(connections=1, path=[event.segment]))
 
         # Connecting flights (2 legs)
-        for first in events:
-            if (
-                first.departure_city != origin
-                or first.arrival_city == destination
-                or first.departure_datetime.date() != date
-            ):
+        hub_rules: dict[str, ConnectionRules] = {}
+        for first in index.departing(origin, day_start, day_end):
+            hub = first.arrival_city
+            if hub == destination:
+                continue
+            if hub not in hub_rules:
+                hub_rules[hub] = rules.for_airport(hub)
+            connection = hub_rules[hub]
+            if not connection.has_connection_window:
                 continue
 
-            for second in events:
-                if (
-                    second.departure_city != first.arrival_city
-                    or second.arrival_city != destination
-                    or second.departure_datetime <= first.arrival_datetime
-                ):
-                    continue
-                if not _connection_within_limit(
-                    first.arrival_datetime,
-                    second.departure_datetime,
-                ):
-                    continue
-                if not _total_duration_within_limit(
-                    first.departure_datetime,
-                    second.arrival_datetime,
-                ):
+            latest_arrival = _shift(
+                first.departure_datetime, connection.max_journey_duration
+            )
+            if first.arrival_datetime >= latest_arrival:
+                continue
+
+            # A connection must leave strictly after the first leg lands, and
+            # the second leg must depart before the journey deadline.
+            window_start = _shift(first.arrival_datetime, connection.min_connection)
+            window_end = min(
+                _shift(first.arrival_datetime, connection.max_connection),
+                latest_arrival,
+            )
+            candidates = index.route(
+                hub,
+                destination,
+                window_start,
+                window_end,
+                include_start=connection.min_connection > timedelta(0),
+            )
+            for second in candidates:
+                if second.arrival_datetime > latest_arrival:
                     continue
 
                 key = (first.flight_number, second.flight_number)
                 if key not in seen:
                     seen.add(key)
-                    path = [
-                        _event_to_segment(first),
-                        _event_to_segment(second),
-                    ]
+                    path = [first.segment, second.segment]
                     results.append(JourneySearchResult(connections=2, path=path))
 
         results.sort(key=lambda r: r.path[0].departure_time)
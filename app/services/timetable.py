@@ -0,0 +1,269 @@
+import sys
+import threading
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict, defaultdict
+from datetime import date, datetime, timedelta, timezone
+from typing import Callable
+
+from app.models.flight_event import FlightEvent
+from app.schemas.journey import FlightPathSegment
+
+PartitionLoader = Callable[[date], list[FlightEvent]]
+
+
+class IndexedEvent:
+    """
+    Compact, immutable view of a FlightEvent held by an EventIndex.
+
+    City codes and flight numbers are interned, so repeated codes share one
+    string. The response segment is built on first use and then reused by
+    every journey that contains this flight, for as long as the index lives.
+    """
+
+    __slots__ = (
+        "flight_number",
+        "departure_city",
+        "arrival_city",
+        "departure_datetime",
+        "arrival_datetime",
+        "_segment",
+    )
+
+    flight_number: str
+    departure_city: str
+    arrival_city: str
+    departure_datetime: datetime
+    arrival_datetime: datetime
+    _segment: FlightPathSegment | None
+
+    def __init__(self, event: FlightEvent) -> None:
+        set_attr = object.__setattr__
+        set_attr(self, "flight_number", sys.intern(event.flight_number))
+        set_attr(self, "departure_city", sys.intern(event.departure_city))
+        set_attr(self, "arrival_city", sys.intern(event.arrival_city))
+        set_attr(self, "departure_datetime", event.departure_datetime)
+        set_attr(self, "arrival_datetime", event.arrival_datetime)
+        set_attr(self, "_segment", None)
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    @property
+    def segment(self) -> FlightPathSegment:
+        """The shared response segment for this flight."""
+        segment = self._segment
+        if segment is None:
+            # Concurrent first calls may both build one; either is equivalent.
+            segment = FlightPathSegment(
+                flight_number=self.flight_number,
+                from_=self.departure_city,
+                to=self.arrival_city,
+                departure_time=self.departure_datetime,
+                arrival_time=self.arrival_datetime,
+            )
+            object.__setattr__(self, "_segment", segment)
+        return segment
+
+
+class _DepartureIndex:
+    """Events sorted by departure time, searchable by departure window."""
+
+    __slots__ = ("events", "departures")
+
+    def __init__(self, events: list[IndexedEvent]) -> None:
+        self.events = sorted(events, key=lambda e: e.departure_datetime)
+        self.departures = [e.departure_datetime for e in self.events]
+
+    def window(
+        self,
+        start: datetime,
+        end: datetime,
+        *,
+        include_start: bool = True,
+    ) -> list[IndexedEvent]:
+        """
+        Return events departing between ``start`` and ``end`` (inclusive).
+
+        With ``include_start=False`` events departing exactly at ``start``
+        are excluded.
+        """
+        bisect_start = bisect_left if include_start else bisect_right
+        lo = bisect_start(self.departures, start)
+        hi = bisect_right(self.departures, end, lo=lo)
+        return self.events[lo:hi]
+
+
+class EventIndex:
+    """
+    Departure indexes keyed by origin city and by (origin, destination) route.
+
+    Events are stored once as IndexedEvent entries shared by both indexes;
+    the source FlightEvent objects are not retained.
+    """
+
+    __slots__ = ("_by_origin", "_by_route", "_size")
+
+    def __init__(self, events: list[FlightEvent]) -> None:
+        by_origin: dict[str, list[IndexedEvent]] = defaultdict(list)
+        by_route: dict[tuple[str, str], list[IndexedEvent]] = defaultdict(list)
+        for source in events:
+            event = IndexedEvent(source)
+            by_origin[event.departure_city].append(event)
+            by_route[(event.departure_city, event.arrival_city)].append(event)
+        self._by_origin = {k: _DepartureIndex(v) for k, v in by_origin.items()}
+        self._by_route = {k: _DepartureIndex(v) for k, v in by_route.items()}
+        self._size = len(events)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def departing(
+        self,
+        origin: str,
+        start: datetime,
+        end: datetime,
+    ) -> list[IndexedEvent]:
+        index = self._by_origin.get(origin)
+        return index.window(start, end) if index else []
+
+    def route(
+        self,
+        origin: str,
+        destination: str,
+        start: datetime,
+        end: datetime,
+        *,
+        include_start: bool = True,
+    ) -> list[IndexedEvent]:
+        index = self._by_route.get((origin, destination))
+        if index is None:
+            return []
+        return index.window(start, end, include_start=include_start)
+
+
+def _partition_cost(index: EventIndex) -> int:
+    return max(len(index), 1)
+
+
+def _utc_today() -> date:
+    return datetime.now(timezone.utc).date()
+
+
+class PartitionedTimetable:
+    """
+    Timetable split into per-departure-date partitions, loaded on first access.
+
+    Each partition holds the events departing on one UTC date, already
+    indexed. Loaded partitions are kept while the total number of cached
+    events stays under ``max_events``; beyond that, partitions for dates
+    before today are evicted first, then the least recently used ones.
+    When the UTC date rolls over, partitions for dates before the new day are
+    dropped without waiting for the cap.
+
+    The cap is counted in events as a proxy for memory; a partition with no
+    events still counts as one, so requests for empty dates cannot grow the
+    cache without bound. The partition just requested is never evicted, so a
+    single oversized date still loads.
+
+    Safe to share between the threads serving sync routes.
+    """
+
+    def __init__(
+        self,
+        loader: PartitionLoader,
+        max_events: int | None = None,
+        today: Callable[[], date] = _utc_today,
+    ) -> None:
+        self._loader = loader
+        self._max_events = max_events
+        self._today = today
+        self._partitions: OrderedDict[date, EventIndex] = OrderedDict()
+        self._cached_events = 0
+        self._current_day: date | None = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_events(
+        cls,
+        events: list[FlightEvent],
+        max_events: int | None = None,
+    ) -> "PartitionedTimetable":
+        """Build a timetable over an in-memory event list."""
+        by_date: dict[date, list[FlightEvent]] = defaultdict(list)
+        for event in events:
+            by_date[event.departure_datetime.date()].append(event)
+        return cls(lambda day: by_date.get(day, []), max_events=max_events)
+
+    @property
+    def loaded_dates(self) -> list[date]:
+        """Dates currently in memory, least recently used first."""
+        with self._lock:
+            return list(self._partitions)
+
+    @property
+    def cached_events(self) -> int:
+        """Events held in memory, counting each empty partition as one."""
+        return self._cached_events
+
+    def partition(self, day: date) -> EventIndex:
+        """Return the indexed events departing on ``day``, loading them if needed."""
+        with self._lock:
+            self._roll_over()
+            index = self._partitions.get(day)
+            if index is not None:
+                self._partitions.move_to_end(day)
+                return index
+
+        # Load outside the lock so a slow loader does not block other dates.
+        events = [e for e in self._loader(day) if e.departure_datetime.date() == day]
+        index = EventIndex(events)
+
+        with self._lock:
+            existing = self._partitions.get(day)
+            if existing is not None:
+                self._partitions.move_to_end(day)
+                return existing
+            self._partitions[day] = index
+            self._cached_events += _partition_cost(index)
+            self._evict(keep=day)
+        return index
+
+    def partitions(self, first_day: date, last_day: date) -> list[EventIndex]:
+        """Return the partitions for every date from ``first_day`` to ``last_day``."""
+        days = (last_day - first_day).days
+        return [self.partition(first_day + timedelta(days=n)) for n in range(days + 1)]
+
+    def evict_before(self, day: date) -> None:
+        """Drop every partition for a date before ``day``."""
+        with self._lock:
+            self._evict_before(day)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._partitions.clear()
+            self._cached_events = 0
+
+    def _roll_over(self) -> None:
+        today = self._today()
+        if today != self._current_day:
+            self._current_day = today
+            self._evict_before(today)
+
+    def _evict_before(self, day: date) -> None:
+        for cached_day in [d for d in self._partitions if d < day]:
+            self._drop(cached_day)
+
+    def _evict(self, keep: date) -> None:
+        if self._max_events is None or self._cached_events <= self._max_events:
+            return
+        today = self._today()
+        past = [d for d in self._partitions if d < today and d != keep]
+        cold = [d for d in self._partitions if d >= today and d != keep]
+        for cached_day in past + cold:
+            if self._cached_events <= self._max_events:
+                break
+            self._drop(cached_day)
+
+    def _drop(self, day: date) -> None:
+        index = self._partitions.pop(day)
+        self._cached_events -= _partition_cost(index)
@@ -0,0 +1,432 @@
+"""
+End-to-end load test for the journey search API.
+
+Starts ``app.main:app`` under uvicorn with a synthetic timetable, replays a
+skewed query mix at a target request rate and writes a JSON report with
+throughput, latency percentiles and error rates.
+
+Usage:
+    python -m benchmarks.load_test --workers 2 --rps 200 --duration 30 \\
+        --output load_report.json --baseline previous_report.json
+
+Requests are sent open-loop: each one is scheduled at a fixed offset from the
+start and its latency is measured from that scheduled time, so a saturated
+server shows up as growing latency instead of a silently lower send rate.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+
+import httpx
+
+from app.services.events_provider import synthetic_city_codes
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+SEARCH_PATH = "/journeys/search"
+
+
+@dataclass
+class LoadTestConfig:
+    workers: int = 1
+    rps: float = 100.0
+    duration: float = 20.0
+    warmup: float = 2.0
+    concurrency: int = 256
+    timeout: float = 10.0
+    host: str = "127.0.0.1"
+    port: int = 0
+    cities: int = 30
+    flights_per_day: int = 500
+    days: int = 3
+    start_date: date = date(2026, 9, 12)
+    skew: float = 1.2
+    seed: int = 0
+
+
+@dataclass
+class Sample:
+    latency: float
+    status: int | None
+    size: int = 0
+    error: str | None = None
+
+
+@dataclass
+class RunResult:
+    samples: list[Sample] = field(default_factory=list)
+    elapsed: float = 0.0
+
+
+def build_query_mix(config: LoadTestConfig) -> tuple[list[str], list[float]]:
+    """
+    Return search URLs and their weights.
+
+    Origin/destination pairs are ranked by a seeded shuffle and weighted
+    ``1 / rank**skew`` so a few routes dominate, like real search traffic.
+    """
+    rng = random.Random(config.seed)
+    cities = synthetic_city_codes(config.cities)
+    pairs = [(o, d) for o in cities for d in cities if o != d]
+    rng.shuffle(pairs)
+    # Query every timetable day except the last, which has no next day for
+    # overnight connections (a single-day timetable still queries its day).
+    dates = [
+        config.start_date + timedelta(days=offset)
+        for offset in range(max(config.days - 1, 1))
+    ]
+    urls: list[str] = []
+    weights: list[float] = []
+    for rank, (origin, destination) in enumerate(pairs, start=1):
+        for day in dates:
+            urls.append(
+                f"{SEARCH_PATH}?date={day.isoformat()}&from={origin}&to={destination}"
+            )
+            weights.append(1 / rank**config.skew)
+    return urls, weights
+
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, round(pct / 100 * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def summarize(result: RunResult) -> dict:
+    """Aggregate samples into throughput, latency and error figures."""
+    total = len(result.samples)
+    ok = [s for s in result.samples if s.status is not None and s.status < 400]
+    latencies_ms = sorted(s.latency * 1000 for s in ok)
+    status_counts = Counter(
+        str(s.status) if s.status is not None else (s.error or "error")
+        for s in result.samples
+    )
+    errors = total - len(ok)
+    return {
+        "requests": total,
+        "successful": len(ok),
+        "errors": errors,
+        "error_rate": errors / total if total else 0.0,
+        "status_counts": dict(sorted(status_counts.items())),
+        "elapsed_s": round(result.elapsed, 3),
+        "throughput_rps": round(len(ok) / result.elapsed, 2) if result.elapsed else 0.0,
+        "latency_ms": {
+            "p50": round(percentile(latencies_ms, 50), 3),
+            "p95": round(percentile(latencies_ms, 95), 3),
+            "p99": round(percentile(latencies_ms, 99), 3),
+            "mean": (
+                round(sum(latencies_ms) / len(latencies_ms), 3) if latencies_ms else 0.0
+            ),
+            "max": round(latencies_ms[-1], 3) if latencies_ms else 0.0,
+        },
+        "mean_response_bytes": (
+            round(sum(s.size for s in ok) / len(ok), 1) if ok else 0.0
+        ),
+    }
+
+
+def compare(report: dict, baseline: dict) -> dict:
+    """Relative change of the headline metrics against a previous report."""
+
+    def change(current: float, previous: float) -> float | None:
+        return round((current - previous) / previous, 4) if previous else None
+
+    return {
+        "baseline_commit": baseline.get("commit"),
+        "throughput_rps": change(
+            report["summary"]["throughput_rps"], baseline["summary"]["throughput_rps"]
+        ),
+        "error_rate": round(
+            report["summary"]["error_rate"] - baseline["summary"]["error_rate"], 4
+        ),
+        "latency_ms": {
+            key: change(
+                report["summary"]["latency_ms"][key],
+                baseline["summary"]["latency_ms"][key],
+            )
+            for key in ("p50", "p95", "p99")
+        },
+    }
+
+
+def _free_port(host: str) -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind((host, 0))
+        return sock.getsockname()[1]
+
+
+def _git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=PROJECT_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def start_server(config: LoadTestConfig) -> subprocess.Popen:
+    """Start uvicorn in a subprocess serving the synthetic timetable."""
+    env = {
+        **os.environ,
+        "ENVIRONMENT": "loadtest",
+        "EVENTS_SOURCE": "synthetic",
+        "SYNTHETIC_CITY_COUNT": str(config.cities),
+        "SYNTHETIC_FLIGHTS_PER_DAY": str(config.flights_per_day),
+        "SYNTHETIC_DAYS": str(config.days),
+        "SYNTHETIC_START_DATE": config.start_date.isoformat(),
+        "SYNTHETIC_SEED": str(config.seed),
+    }
+    return subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "app.main:app",
+            "--host",
+            config.host,
+            "--port",
+            str(config.port),
+            "--workers",
+            str(config.workers),
+            "--log-level",
+            "warning",
+            "--no-access-log",
+        ],
+        cwd=PROJECT_ROOT,
+        env=env,
+    )
+
+
+async def wait_until_ready(
+    client: httpx.AsyncClient,
+    server: subprocess.Popen,
+    timeout: float = 30.0,
+) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if server.poll() is not None:
+            raise RuntimeError(f"Server exited with code {server.returncode}")
+        try:
+            await client.get(SEARCH_PATH)
+            return
+        except httpx.TransportError:
+            await asyncio.sleep(0.1)
+    raise RuntimeError("Server did not become ready in time")
+
+
+async def _send(
+    client: httpx.AsyncClient,
+    url: str,
+    scheduled: float,
+    limit: asyncio.Semaphore,
+    samples: list[Sample],
+) -> None:
+    async with limit:
+        try:
+            response = await client.get(url)
+            samples.append(
+                Sample(
+                    latency=time.perf_counter() - scheduled,
+                    status=response.status_code,
+                    size=len(response.content),
+                )
+            )
+        except httpx.HTTPError as exc:
+            samples.append(
+                Sample(
+                    latency=time.perf_counter() - scheduled,
+                    status=None,
+                    error=type(exc).__name__,
+                )
+            )
+
+
+async def run_phase(
+    client: httpx.AsyncClient,
+    config: LoadTestConfig,
+    urls: list[str],
+    weights: list[float],
+    duration: float,
+    rng: random.Random,
+) -> RunResult:
+    """Send requests at ``config.rps`` for ``duration`` seconds."""
+    total = int(config.rps * duration)
+    chosen = rng.choices(urls, weights=weights, k=total)
+    limit = asyncio.Semaphore(config.concurrency)
+    result = RunResult()
+    tasks = []
+    start = time.perf_counter()
+    for i, url in enumerate(chosen):
+        scheduled = start + i / config.rps
+        delay = scheduled - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        tasks.append(
+            asyncio.create_task(_send(client, url, scheduled, limit, result.samples))
+        )
+    await asyncio.gather(*tasks)
+    result.elapsed = time.perf_counter() - start
+    return result
+
+
+async def run_load_test(config: LoadTestConfig) -> dict:
+    if not config.port:
+        config.port = _free_port(config.host)
+    urls, weights = build_query_mix(config)
+    rng = random.Random(config.seed)
+    server = start_server(config)
+    try:
+        async with httpx.AsyncClient(
+            base_url=f"http://{config.host}:{config.port}",
+            timeout=config.timeout,
+            limits=httpx.Limits(
+                max_connections=config.concurrency,
+                max_keepalive_connections=config.concurrency,
+            ),
+        ) as client:
+            await wait_until_ready(client, server)
+            if config.warmup > 0:
+                await run_phase(client, config, urls, weights, config.warmup, rng)
+            result = await run_phase(
+                client, config, urls, weights, config.duration, rng
+            )
+    finally:
+        server.terminate()
+        try:
+            server.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            server.kill()
+
+    config_report = {
+        key: value.isoformat() if isinstance(value, date) else value
+        for key, value in vars(config).items()
+    }
+    return {
+        "commit": _git_commit(),
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": sys.version.split()[0],
+        "config": config_report,
+        "summary": summarize(result),
+    }
+
+
+def parse_args(
+    argv: list[str] | None = None,
+) -> tuple[LoadTestConfig, argparse.Namespace]:
+    defaults = LoadTestConfig()
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=defaults.workers,
+        help="uvicorn worker processes",
+    )
+    parser.add_argument(
+        "--rps",
+        type=float,
+        default=defaults.rps,
+        help="target requests per second",
+    )
+    parser.add_argument(
+        "--duration",
+        type=float,
+        default=defaults.duration,
+        help="measured seconds",
+    )
+    parser.add_argument(
+        "--warmup",
+        type=float,
+        default=defaults.warmup,
+        help="unmeasured warm-up seconds",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=defaults.concurrency,
+        help="max in-flight requests",
+    )
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=defaults.timeout,
+        help="per-request timeout (s)",
+    )
+    parser.add_argument("--host", default=defaults.host)
+    parser.add_argument(
+        "--port",
+        type=int,
+        default=defaults.port,
+        help="0 picks a free port",
+    )
+    parser.add_argument("--cities", type=int, default=defaults.cities)
+    parser.add_argument("--flights-per-day", type=int, default=defaults.flights_per_day)
+    parser.add_argument("--days", type=int, default=defaults.days)
+    parser.add_argument(
+        "--start-date",
+        type=date.fromisoformat,
+        default=defaults.start_date,
+    )
+    parser.add_argument(
+        "--skew",
+        type=float,
+        default=defaults.skew,
+        help="Zipf exponent of the query mix",
+    )
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+    parser.add_argument("--output", type=Path, help="write the JSON report here")
+    parser.add_argument(
+        "--baseline",
+        type=Path,
+        help="previous report to compare against",
+    )
+    args = parser.parse_args(argv)
+    config = LoadTestConfig(
+        workers=args.workers,
+        rps=args.rps,
+        duration=args.duration,
+        warmup=args.warmup,
+        concurrency=args.concurrency,
+        timeout=args.timeout,
+        host=args.host,
+        port=args.port,
+        cities=args.cities,
+        flights_per_day=args.flights_per_day,
+        days=args.days,
+        start_date=args.start_date,
+        skew=args.skew,
+        seed=args.seed,
+    )
+    return config, args
+
+
+def main(argv: list[str] | None = None) -> int:
+    config, args = parse_args(argv)
+    report = asyncio.run(run_load_test(config))
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text())
+        report["comparison"] = compare(report, baseline)
+    output = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(output + "\n")
+    print(output)
+    return 0 if report["summary"]["errors"] == 0 else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
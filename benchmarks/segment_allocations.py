@@ -0,0 +1,96 @@
+"""
+Allocation benchmark for journey search result construction.
+
+Runs a fixed query mix against a synthetic timetable and reports, with
+tracemalloc, the memory blocks allocated by the searches, plus how many
+distinct segment objects back the segments referenced by the results.
+
+Usage:
+    python -m benchmarks.segment_allocations --cities 20 --flights-per-day 2000
+"""
+
+import argparse
+import gc
+import json
+import time
+import tracemalloc
+from datetime import date, timedelta
+
+from app.services.events_provider import generate_synthetic_events, synthetic_city_codes
+from app.services.journey_search import JourneySearchService
+from app.services.timetable import PartitionedTimetable
+
+
+def run(
+    cities: int,
+    flights_per_day: int,
+    days: int,
+    queries: int,
+    start_date: date,
+    seed: int,
+) -> dict:
+    events = generate_synthetic_events(cities, flights_per_day, days, start_date, seed)
+    timetable = PartitionedTimetable.from_events(events)
+    del events
+    service = JourneySearchService()
+    codes = synthetic_city_codes(cities)
+    # The busiest routes: hubs are the first codes of the synthetic timetable.
+    pairs = [(o, d) for o in codes for d in codes if o != d][:queries]
+    search_dates = [start_date + timedelta(days=n) for n in range(max(days - 1, 1))]
+
+    # Load every partition up front so only search work is measured.
+    timetable.partitions(start_date, start_date + timedelta(days=days))
+
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    started = time.perf_counter()
+    results = [
+        service.search(day, origin, destination, timetable)
+        for day in search_dates
+        for origin, destination in pairs
+    ]
+    elapsed = time.perf_counter() - started
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    stats = after.compare_to(before, "filename")
+    segments = [s for journeys in results for journey in journeys for s in journey.path]
+    return {
+        "searches": len(results),
+        "journeys": sum(len(journeys) for journeys in results),
+        "segment_references": len(segments),
+        "distinct_segment_objects": len({id(s) for s in segments}),
+        "allocated_blocks": sum(s.count_diff for s in stats if s.count_diff > 0),
+        "allocated_kib": round(
+            sum(s.size_diff for s in stats if s.size_diff > 0) / 1024, 1
+        ),
+        "elapsed_s": round(elapsed, 3),
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--cities", type=int, default=20)
+    parser.add_argument("--flights-per-day", type=int, default=2000)
+    parser.add_argument("--days", type=int, default=3)
+    parser.add_argument("--queries", type=int, default=50)
+    parser.add_argument(
+        "--start-date", type=date.fromisoformat, default=date(2026, 9, 12)
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+    report = run(
+        cities=args.cities,
+        flights_per_day=args.flights_per_day,
+        days=args.days,
+        queries=args.queries,
+        start_date=args.start_date,
+        seed=args.seed,
+    )
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -7,6 +7,7 @@ from fastapi.testclient import TestClient
 
 from app.main import app
 from app.models.flight_event import FlightEvent
+from app.services.timetable import PartitionedTimetable
 
 
 def _utc(year: int, month: int, day: int, hour: int = 0, minute: int = 0) -> datetime:
@@ -58,7 +59,8 @@ def test_search_journeys_happy_path(client: TestClient) -> None:
     )
     mock_events = [direct, leg1, leg2]
 
-    with patch("app.api.journeys.get_flight_events", return_value=mock_events):
+    timetable = PartitionedTimetable.from_events(mock_events)
+    with patch("app.api.journeys.get_timetable", return_value=timetable):
         response = client.get(
             "/journeys/search?date=2026-09-12&from=BUE&to=MAD"
         )
@@ -84,7 +86,8 @@ def test_search_journeys_happy_path(client: TestClient) -> None:
 
 
 def test_search_journeys_no_results(client: TestClient) -> None:
-    with patch("app.api.journeys.get_flight_events", return_value=[]):
+    timetable = PartitionedTimetable.from_events([])
+    with patch("app.api.journeys.get_timetable", return_value=timetable):
         response = client.get(
             "/journeys/search?date=2026-09-12&from=BUE&to=MAD"
         )
@@ -93,12 +96,83 @@ def test_search_journeys_no_results(client: TestClient) -> None:
     assert response.json() == []
 
 
+def test_search_journeys_min_connection_query_param(client: TestClient) -> None:
+    leg1 = _event(
+        "AR200",
+        "BUE",
+        "GRU",
+        _utc(2026, 9, 12, 9, 0),
+        _utc(2026, 9, 12, 11, 0),
+    )
+    leg2 = _event(
+        "IB201",
+        "GRU",
+        "MAD",
+        _utc(2026, 9, 12, 13, 0),
+        _utc(2026, 9, 12, 23, 0),
+    )
+
+    timetable = PartitionedTimetable.from_events([leg1, leg2])
+    with patch("app.api.journeys.get_timetable", return_value=timetable):
+        response = client.get(
+            "/journeys/search?date=2026-09-12&from=BUE&to=MAD"
+            "&min_connection_minutes=180"
+        )
+
+    assert response.status_code == 200
+    assert response.json() == []
+
+
+def test_search_journeys_on_last_representable_date(client: TestClient) -> None:
+    timetable = PartitionedTimetable.from_events([])
+    with patch("app.api.journeys.get_timetable", return_value=timetable):
+        response = client.get("/journeys/search?date=9999-12-31&from=BUE&to=MAD")
+
+    assert response.status_code == 200
+    assert response.json() == []
+
+
+def test_search_journeys_near_last_date_with_longest_duration(
+    client: TestClient,
+) -> None:
+    timetable = PartitionedTimetable.from_events([])
+    with patch("app.api.journeys.get_timetable", return_value=timetable):
+        response = client.get(
+            "/journeys/search?date=9999-12-29&from=BUE&to=MAD"
+            "&max_journey_duration_minutes=4320"
+        )
+
+    assert response.status_code == 200
+    assert response.json() == []
+    assert timetable.loaded_dates == [date(9999, 12, 29), date(9999, 12, 30), date.max]
+
+
+def test_search_journeys_huge_duration_rejected_without_loading_partitions(
+    client: TestClient,
+) -> None:
+    timetable = PartitionedTimetable.from_events([])
+    with patch("app.api.journeys.get_timetable", return_value=timetable):
+        response = client.get(
+            "/journeys/search?date=2026-09-12&from=BUE&to=MAD"
+            "&max_journey_duration_minutes=1000000"
+        )
+
+    assert response.status_code == 422
+    assert timetable.loaded_dates == []
+
+
 @pytest.mark.parametrize(
     "query",
     [
         "/journeys/search?from=BUE&to=MAD",
         "/journeys/search?date=2026-09-12&to=MAD",
         "/journeys/search?date=2026-09-12&from=BUE",
+        "/journeys/search?date=2026-09-12&from=BUE&to=MAD&min_connection_minutes=-1",
+        "/journeys/search?date=2026-09-12&from=BUE&to=MAD&min_connection_minutes=300",
+        "/journeys/search?date=2026-09-12&from=BUE&to=MAD"
+        "&max_connection_minutes=100000000000",
+        "/journeys/search?date=2026-09-12&from=BUE&to=MAD"
+        "&max_journey_duration_minutes=1000000",
     ],
 )
 def test_search_journeys_validation_errors(client: TestClient, query: str) -> None:
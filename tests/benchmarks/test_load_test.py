@@ -0,0 +1,122 @@
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from benchmarks.load_test import (
+    LoadTestConfig,
+    RunResult,
+    Sample,
+    build_query_mix,
+    compare,
+    percentile,
+    summarize,
+)
+
+
+def _report(
+    throughput: float,
+    error_rate: float,
+    p50: float,
+    p95: float,
+    p99: float,
+) -> dict:
+    return {
+        "commit": "abc1234",
+        "summary": {
+            "throughput_rps": throughput,
+            "error_rate": error_rate,
+            "latency_ms": {"p50": p50, "p95": p95, "p99": p99},
+        },
+    }
+
+
+@pytest.mark.parametrize(
+    ("pct", "expected"),
+    [(50, 5.0), (95, 10.0), (99, 10.0), (10, 1.0), (0, 1.0), (100, 10.0)],
+)
+def test_percentile_uses_nearest_rank(pct: float, expected: float) -> None:
+    values = [float(v) for v in range(1, 11)]
+    assert percentile(values, pct) == expected
+
+
+def test_percentile_of_empty_list_is_zero() -> None:
+    assert percentile([], 99) == 0.0
+
+
+def test_summarize_counts_errors_and_throughput_from_successes_only() -> None:
+    result = RunResult(
+        samples=[
+            Sample(latency=0.010, status=200, size=100),
+            Sample(latency=0.030, status=200, size=300),
+            Sample(latency=0.500, status=500, size=10),
+            Sample(latency=1.000, status=None, error="ReadTimeout"),
+        ],
+        elapsed=2.0,
+    )
+
+    summary = summarize(result)
+
+    assert summary["requests"] == 4
+    assert summary["successful"] == 2
+    assert summary["errors"] == 2
+    assert summary["error_rate"] == 0.5
+    assert summary["status_counts"] == {"200": 2, "500": 1, "ReadTimeout": 1}
+    assert summary["throughput_rps"] == 1.0
+    assert summary["latency_ms"]["p50"] == 10.0
+    assert summary["latency_ms"]["max"] == 30.0
+    assert summary["latency_ms"]["mean"] == 20.0
+    assert summary["mean_response_bytes"] == 200.0
+
+
+def test_summarize_empty_run() -> None:
+    summary = summarize(RunResult())
+    assert summary["requests"] == 0
+    assert summary["error_rate"] == 0.0
+    assert summary["throughput_rps"] == 0.0
+    assert summary["latency_ms"]["p99"] == 0.0
+
+
+def test_compare_reports_relative_change() -> None:
+    comparison = compare(
+        _report(120.0, 0.02, 11.0, 30.0, 60.0),
+        _report(100.0, 0.01, 10.0, 20.0, 40.0),
+    )
+
+    assert comparison["baseline_commit"] == "abc1234"
+    assert comparison["throughput_rps"] == 0.2
+    assert comparison["error_rate"] == 0.01
+    assert comparison["latency_ms"] == {"p50": 0.1, "p95": 0.5, "p99": 0.5}
+
+
+def test_compare_with_zero_baseline_gives_no_relative_change() -> None:
+    comparison = compare(
+        _report(100.0, 0.0, 10.0, 20.0, 40.0),
+        _report(0.0, 0.0, 0.0, 0.0, 0.0),
+    )
+
+    assert comparison["throughput_rps"] is None
+    assert comparison["latency_ms"] == {"p50": None, "p95": None, "p99": None}
+
+
+def test_query_mix_covers_all_pairs_and_dates_except_last() -> None:
+    config = LoadTestConfig(cities=4, days=3)
+
+    urls, weights = build_query_mix(config)
+
+    queries = [parse_qs(urlparse(url).query) for url in urls]
+    pairs = {(q["from"][0], q["to"][0]) for q in queries}
+    dates = {q["date"][0] for q in queries}
+    assert len(urls) == len(weights) == 4 * 3 * 2
+    assert len(pairs) == 12
+    assert all(origin != destination for origin, destination in pairs)
+    assert dates == {"2026-09-12", "2026-09-13"}
+
+
+def test_query_mix_is_skewed_and_deterministic() -> None:
+    config = LoadTestConfig(cities=5, days=2, skew=1.2, seed=3)
+
+    urls, weights = build_query_mix(config)
+
+    assert (urls, weights) == build_query_mix(config)
+    assert weights == sorted(weights, reverse=True)
+    assert weights[0] / weights[-1] == pytest.approx(20**1.2)
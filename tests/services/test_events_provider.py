@@ -0,0 +1,74 @@
+from datetime import date
+from unittest.mock import patch
+
+import pytest
+
+from app.services.events_provider import (
+    generate_synthetic_events,
+    get_flight_events_for_date,
+    synthetic_city_codes,
+)
+
+
+def test_synthetic_city_codes_are_unique_three_letter_codes() -> None:
+    codes = synthetic_city_codes(800)
+    assert codes[:3] == ["AAA", "AAB", "AAC"]
+    assert len(set(codes)) == 800
+    assert all(len(code) == 3 and code.isupper() for code in codes)
+
+
+def test_synthetic_city_codes_cover_all_codes_without_repeats() -> None:
+    codes = synthetic_city_codes(26**3)
+    assert codes[-1] == "ZZZ"
+    assert len(set(codes)) == 26**3
+    with pytest.raises(ValueError):
+        synthetic_city_codes(26**3 + 1)
+
+
+def test_synthetic_events_are_deterministic_and_sized() -> None:
+    first = generate_synthetic_events(10, 50, 2, date(2026, 9, 12), seed=7)
+    second = generate_synthetic_events(10, 50, 2, date(2026, 9, 12), seed=7)
+    assert len(first) == 100
+    assert first == second
+
+
+def test_synthetic_events_depart_within_configured_days() -> None:
+    events = generate_synthetic_events(5, 20, 3, date(2026, 9, 12))
+    departure_dates = {e.departure_datetime.date() for e in events}
+    assert departure_dates == {date(2026, 9, 12), date(2026, 9, 13), date(2026, 9, 14)}
+    assert all(e.departure_city != e.arrival_city for e in events)
+
+
+def test_flight_events_for_date_defaults_to_sample_data() -> None:
+    flight_numbers = [
+        e.flight_number for e in get_flight_events_for_date(date(2026, 9, 12))
+    ]
+    assert "IB100" in flight_numbers
+
+
+def test_flight_events_for_date_returns_synthetic_data_when_configured() -> None:
+    with patch("app.services.events_provider.settings.events_source", "synthetic"):
+        events = get_flight_events_for_date(date(2026, 9, 12))
+    assert events and all(e.flight_number.startswith("SY") for e in events)
+
+
+def test_flight_events_for_date_matches_full_synthetic_timetable() -> None:
+    full = generate_synthetic_events(10, 50, 3, date(2026, 9, 12))
+    with (
+        patch("app.services.events_provider.settings.events_source", "synthetic"),
+        patch("app.services.events_provider.settings.synthetic_city_count", 10),
+        patch("app.services.events_provider.settings.synthetic_flights_per_day", 50),
+        patch("app.services.events_provider.settings.synthetic_days", 3),
+    ):
+        second_day = get_flight_events_for_date(date(2026, 9, 13))
+        outside = get_flight_events_for_date(date(2026, 9, 20))
+    assert second_day == full[50:100]
+    assert outside == []
+
+
+def test_flight_events_for_date_filters_sample_data() -> None:
+    assert get_flight_events_for_date(date(2026, 9, 11)) == []
+    events = get_flight_events_for_date(date(2026, 9, 12))
+    assert events and all(
+        e.departure_datetime.date() == date(2026, 9, 12) for e in events
+    )
@@ -2,6 +2,7 @@ from datetime import date, datetime, timezone
 
 import pytest
 
+from app.models.connection_rules import AirportConnectionRules, ConnectionRules
 from app.models.flight_event import FlightEvent
 from app.services.journey_search import JourneySearchService
 
@@ -215,3 +216,268 @@ def test_departure_time_is_timezone_aware(service: JourneySearchService) -> None
     )
     result = service.search(date(2026, 9, 12), "BUE", "MAD", [event])[0]
     assert result.path[0].departure_time.tzinfo is timezone.utc
+
+
+def _connecting_events() -> list[FlightEvent]:
+    return [
+        _event(
+            "XX100",
+            "BUE",
+            "MAD",
+            _utc(2026, 9, 12, 12, 0),
+            _utc(2026, 9, 12, 20, 0),
+        ),
+        _event(
+            "XX200",
+            "MAD",
+            "PMI",
+            _utc(2026, 9, 12, 20, 30),
+            _utc(2026, 9, 12, 21, 30),
+        ),
+        _event(
+            "XX300",
+            "MAD",
+            "PMI",
+            _utc(2026, 9, 12, 22, 0),
+            _utc(2026, 9, 12, 23, 0),
+        ),
+    ]
+
+
+def _second_legs(results) -> list[str]:
+    return [r.path[1].flight_number for r in results if r.connections == 2]
+
+
+def test_connection_exactly_at_arrival_rejected_by_default(
+    service: JourneySearchService,
+) -> None:
+    leg1 = _event(
+        "XX100",
+        "BUE",
+        "MAD",
+        _utc(2026, 9, 12, 12, 0),
+        _utc(2026, 9, 12, 20, 0),
+    )
+    leg2 = _event(
+        "XX200",
+        "MAD",
+        "PMI",
+        _utc(2026, 9, 12, 20, 0),
+        _utc(2026, 9, 12, 21, 0),
+    )
+    results = service.search(date(2026, 9, 12), "BUE", "PMI", [leg1, leg2])
+    assert results == []
+
+
+def test_per_request_min_connection_time_excludes_short_connections(
+    service: JourneySearchService,
+) -> None:
+    rules = ConnectionRules(min_connection_minutes=60)
+    results = service.search(
+        date(2026, 9, 12), "BUE", "PMI", _connecting_events(), rules=rules
+    )
+    assert _second_legs(results) == ["XX300"]
+
+
+def test_per_request_max_connection_time_excludes_long_connections(
+    service: JourneySearchService,
+) -> None:
+    rules = ConnectionRules(max_connection_minutes=90)
+    results = service.search(
+        date(2026, 9, 12), "BUE", "PMI", _connecting_events(), rules=rules
+    )
+    assert _second_legs(results) == ["XX200"]
+
+
+def test_airport_override_replaces_base_connection_rules() -> None:
+    rules = ConnectionRules(
+        min_connection_minutes=0,
+        airport_overrides={"mad": AirportConnectionRules(min_connection_minutes=45)},
+    )
+    service = JourneySearchService(rules)
+    results = service.search(date(2026, 9, 12), "BUE", "PMI", _connecting_events())
+    assert _second_legs(results) == ["XX300"]
+
+
+def test_airport_override_can_loosen_max_connection() -> None:
+    leg1 = _event(
+        "XX100",
+        "BUE",
+        "MAD",
+        _utc(2026, 9, 12, 6, 0),
+        _utc(2026, 9, 12, 10, 0),
+    )
+    leg2 = _event(
+        "XX200",
+        "MAD",
+        "PMI",
+        _utc(2026, 9, 12, 16, 0),
+        _utc(2026, 9, 12, 17, 0),
+    )
+    rules = ConnectionRules(
+        airport_overrides={"MAD": AirportConnectionRules(max_connection_minutes=8 * 60)},
+    )
+    results = JourneySearchService(rules).search(
+        date(2026, 9, 12), "BUE", "PMI", [leg1, leg2]
+    )
+    assert _second_legs(results) == ["XX200"]
+
+
+def test_per_request_max_journey_duration_applies_to_direct_flights(
+    service: JourneySearchService,
+) -> None:
+    event = _event(
+        "XX100",
+        "BUE",
+        "MAD",
+        _utc(2026, 9, 12, 8, 0),
+        _utc(2026, 9, 12, 20, 0),
+    )
+    rules = ConnectionRules(max_journey_duration_minutes=11 * 60)
+    results = service.search(date(2026, 9, 12), "BUE", "MAD", [event], rules=rules)
+    assert results == []
+
+
+def test_rules_reject_min_connection_above_max() -> None:
+    with pytest.raises(ValueError):
+        ConnectionRules(min_connection_minutes=300, max_connection_minutes=240)
+
+
+def test_rules_reject_minutes_above_limit() -> None:
+    with pytest.raises(ValueError):
+        ConnectionRules(max_connection_minutes=100_000_000_000)
+    with pytest.raises(ValueError):
+        AirportConnectionRules(max_journey_duration_minutes=1_000_000)
+
+
+def test_airport_with_empty_connection_window_allows_no_connection() -> None:
+    rules = ConnectionRules(
+        airport_overrides={"MAD": AirportConnectionRules(min_connection_minutes=300)}
+    )
+    results = JourneySearchService(rules).search(
+        date(2026, 9, 12), "BUE", "PMI", _connecting_events()
+    )
+    assert results == []
+
+
+def test_request_max_connection_below_airport_mct_only_affects_that_airport() -> None:
+    base = ConnectionRules(
+        airport_overrides={"MAD": AirportConnectionRules(min_connection_minutes=45)}
+    )
+    rules = base.with_overrides(max_connection_minutes=30)
+    service = JourneySearchService()
+
+    via_mad = service.search(
+        date(2026, 9, 12), "BUE", "PMI", _connecting_events(), rules=rules
+    )
+    via_gru = service.search(
+        date(2026, 9, 12),
+        "BUE",
+        "MAD",
+        [
+            _event(
+                "XX400",
+                "BUE",
+                "GRU",
+                _utc(2026, 9, 12, 8, 0),
+                _utc(2026, 9, 12, 10, 0),
+            ),
+            _event(
+                "XX500",
+                "GRU",
+                "MAD",
+                _utc(2026, 9, 12, 10, 20),
+                _utc(2026, 9, 12, 20, 0),
+            ),
+        ],
+        rules=rules,
+    )
+
+    assert via_mad == []
+    assert _second_legs(via_gru) == ["XX500"]
+
+
+def test_request_max_journey_duration_takes_precedence_over_airport_override(
+    service: JourneySearchService,
+) -> None:
+    base = ConnectionRules(
+        airport_overrides={
+            "MAD": AirportConnectionRules(max_journey_duration_minutes=24 * 60)
+        }
+    )
+    rules = base.with_overrides(max_journey_duration_minutes=500)
+
+    results = service.search(
+        date(2026, 9, 12), "BUE", "PMI", _connecting_events(), rules=rules
+    )
+
+    assert results == []
+    assert rules.for_airport("MAD").max_journey_duration_minutes == 500
+
+
+def test_repeated_first_leg_shares_one_segment_object(
+    service: JourneySearchService,
+) -> None:
+    events = _connecting_events()
+    results = service.search(date(2026, 9, 12), "BUE", "PMI", events)
+    assert len(results) == 2
+    assert results[0].path[0] is results[1].path[0]
+    with pytest.raises(ValueError):
+        results[0].path[0].flight_number = "YY100"
+
+
+def test_search_on_last_representable_date(service: JourneySearchService) -> None:
+    leg1 = _event(
+        "XX100",
+        "BUE",
+        "MAD",
+        _utc(9999, 12, 31, 20, 0),
+        _utc(9999, 12, 31, 22, 0),
+    )
+    leg2 = _event(
+        "XX200",
+        "MAD",
+        "PMI",
+        _utc(9999, 12, 31, 23, 0),
+        _utc(9999, 12, 31, 23, 30),
+    )
+    results = service.search(date.max, "BUE", "PMI", [leg1, leg2])
+    assert _second_legs(results) == ["XX200"]
+    assert service.search(date.max, "BUE", "MAD", []) == []
+
+
+def test_request_cannot_bypass_airport_minimum_connection_time(
+    service: JourneySearchService,
+) -> None:
+    base = ConnectionRules(
+        airport_overrides={
+            "MAD": AirportConnectionRules(
+                min_connection_minutes=45, max_connection_minutes=90
+            )
+        }
+    )
+    rules = base.with_overrides(min_connection_minutes=0, max_connection_minutes=240)
+
+    results = service.search(
+        date(2026, 9, 12), "BUE", "PMI", _connecting_events(), rules=rules
+    )
+
+    mad = rules.for_airport("MAD")
+    assert (mad.min_connection_minutes, mad.max_connection_minutes) == (45, 90)
+    assert _second_legs(results) == []
+
+
+def test_request_narrows_airport_connection_window(
+    service: JourneySearchService,
+) -> None:
+    base = ConnectionRules(
+        airport_overrides={"MAD": AirportConnectionRules(min_connection_minutes=20)}
+    )
+    rules = base.with_overrides(min_connection_minutes=60)
+
+    results = service.search(
+        date(2026, 9, 12), "BUE", "PMI", _connecting_events(), rules=rules
+    )
+
+    assert rules.for_airport("MAD").min_connection_minutes == 60
+    assert _second_legs(results) == ["XX300"]
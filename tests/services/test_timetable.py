@@ -0,0 +1,215 @@
+import sys
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+
+from app.models.connection_rules import MAX_RULE_MINUTES, ConnectionRules
+from app.models.flight_event import FlightEvent
+from app.services.journey_search import JourneySearchService
+from app.services.timetable import IndexedEvent, PartitionedTimetable
+
+
+def _utc(year: int, month: int, day: int, hour: int = 0, minute: int = 0) -> datetime:
+    return datetime(year, month, day, hour, minute, tzinfo=timezone.utc)
+
+
+def _event(
+    flight_number: str,
+    from_city: str,
+    to_city: str,
+    depart: datetime,
+    arrive: datetime,
+) -> FlightEvent:
+    return FlightEvent(
+        flight_number=flight_number,
+        departure_city=from_city,
+        arrival_city=to_city,
+        departure_datetime=depart,
+        arrival_datetime=arrive,
+    )
+
+
+class _RecordingLoader:
+    """Loader returning ``per_day`` events for any date and recording calls."""
+
+    def __init__(self, per_day: int = 1) -> None:
+        self.per_day = per_day
+        self.calls: list[date] = []
+
+    def __call__(self, day: date) -> list[FlightEvent]:
+        self.calls.append(day)
+        depart = datetime(day.year, day.month, day.day, 8, 0, tzinfo=timezone.utc)
+        return [
+            _event(f"XX{n}", "BUE", "MAD", depart, depart + timedelta(hours=2))
+            for n in range(self.per_day)
+        ]
+
+
+def test_partitions_are_loaded_lazily_and_once() -> None:
+    loader = _RecordingLoader()
+    timetable = PartitionedTimetable(loader)
+    assert loader.calls == []
+
+    timetable.partition(date(2026, 9, 12))
+    timetable.partition(date(2026, 9, 12))
+
+    assert loader.calls == [date(2026, 9, 12)]
+    assert timetable.loaded_dates == [date(2026, 9, 12)]
+
+
+def test_partition_keeps_only_events_departing_that_date() -> None:
+    events = [
+        _event("XX1", "BUE", "MAD", _utc(2026, 9, 12, 8), _utc(2026, 9, 12, 10)),
+        _event("XX2", "BUE", "MAD", _utc(2026, 9, 13, 8), _utc(2026, 9, 13, 10)),
+    ]
+    timetable = PartitionedTimetable(lambda day: events)
+    assert len(timetable.partition(date(2026, 9, 12))) == 1
+
+
+def test_least_recently_used_partition_evicted_over_cap() -> None:
+    timetable = PartitionedTimetable(
+        _RecordingLoader(per_day=2),
+        max_events=4,
+        today=lambda: date(2026, 9, 1),
+    )
+    timetable.partition(date(2026, 9, 12))
+    timetable.partition(date(2026, 9, 13))
+    timetable.partition(date(2026, 9, 12))
+    timetable.partition(date(2026, 9, 14))
+
+    assert timetable.loaded_dates == [date(2026, 9, 12), date(2026, 9, 14)]
+    assert timetable.cached_events == 4
+
+
+def test_past_partitions_evicted_before_future_ones() -> None:
+    timetable = PartitionedTimetable(
+        _RecordingLoader(per_day=2),
+        max_events=4,
+        today=lambda: date(2026, 9, 13),
+    )
+    timetable.partition(date(2026, 9, 14))
+    timetable.partition(date(2026, 9, 12))
+    timetable.partition(date(2026, 9, 15))
+
+    assert timetable.loaded_dates == [date(2026, 9, 14), date(2026, 9, 15)]
+
+
+def test_oversized_partition_is_still_served() -> None:
+    timetable = PartitionedTimetable(_RecordingLoader(per_day=5), max_events=2)
+    assert len(timetable.partition(date(2026, 9, 12))) == 5
+    assert timetable.loaded_dates == [date(2026, 9, 12)]
+
+
+def test_empty_partitions_count_towards_the_cap() -> None:
+    timetable = PartitionedTimetable(
+        _RecordingLoader(per_day=0),
+        max_events=10,
+        today=lambda: date(2026, 9, 1),
+    )
+    service = JourneySearchService()
+    for n in range(200):
+        service.search(date(2030, 1, 1) + timedelta(days=n), "BUE", "MAD", timetable)
+
+    assert len(timetable.loaded_dates) <= 10
+    assert timetable.cached_events == len(timetable.loaded_dates)
+
+
+def test_evict_before_drops_earlier_dates() -> None:
+    timetable = PartitionedTimetable(_RecordingLoader())
+    timetable.partitions(date(2026, 9, 11), date(2026, 9, 13))
+
+    timetable.evict_before(date(2026, 9, 12))
+
+    assert timetable.loaded_dates == [date(2026, 9, 12), date(2026, 9, 13)]
+    assert timetable.cached_events == 2
+
+
+def test_past_partitions_dropped_when_the_date_rolls_over() -> None:
+    today = [date(2026, 9, 12)]
+    timetable = PartitionedTimetable(_RecordingLoader(), today=lambda: today[0])
+    timetable.partitions(date(2026, 9, 11), date(2026, 9, 13))
+
+    today[0] = date(2026, 9, 13)
+    timetable.partition(date(2026, 9, 14))
+
+    assert timetable.loaded_dates == [date(2026, 9, 13), date(2026, 9, 14)]
+    assert timetable.cached_events == 2
+
+
+@pytest.fixture
+def overnight_events() -> list[FlightEvent]:
+    return [
+        _event("XX100", "BUE", "MAD", _utc(2026, 9, 12, 18), _utc(2026, 9, 12, 23)),
+        _event("XX200", "MAD", "PMI", _utc(2026, 9, 13, 1), _utc(2026, 9, 13, 2)),
+        _event("XX300", "MAD", "PMI", _utc(2026, 9, 20, 1), _utc(2026, 9, 20, 2)),
+    ]
+
+
+def test_search_pulls_next_day_partition_for_overnight_connection(
+    overnight_events: list[FlightEvent],
+) -> None:
+    timetable = PartitionedTimetable.from_events(overnight_events)
+
+    results = JourneySearchService().search(date(2026, 9, 12), "BUE", "PMI", timetable)
+
+    assert [[s.flight_number for s in r.path] for r in results] == [["XX100", "XX200"]]
+    assert timetable.loaded_dates == [date(2026, 9, 12), date(2026, 9, 13)]
+
+
+def test_search_over_timetable_matches_search_over_list(
+    overnight_events: list[FlightEvent],
+) -> None:
+    service = JourneySearchService()
+    timetable = PartitionedTimetable.from_events(overnight_events)
+    for day in (date(2026, 9, 12), date(2026, 9, 13)):
+        assert service.search(day, "BUE", "PMI", timetable) == service.search(
+            day, "BUE", "PMI", overnight_events
+        )
+
+
+def test_indexed_event_interns_codes_and_is_immutable() -> None:
+    source = _event(
+        "".join(["XX", "100"]),
+        "BUE",
+        "MAD",
+        _utc(2026, 9, 12, 8),
+        _utc(2026, 9, 12, 10),
+    )
+    indexed = IndexedEvent(source)
+
+    assert indexed.flight_number is sys.intern("XX100")
+    assert indexed.departure_city is sys.intern("BUE")
+    with pytest.raises(AttributeError):
+        indexed.departure_city = "GRU"
+    with pytest.raises(AttributeError):
+        indexed.extra = 1
+
+
+def test_partition_segments_shared_across_searches(
+    overnight_events: list[FlightEvent],
+) -> None:
+    service = JourneySearchService()
+    timetable = PartitionedTimetable.from_events(overnight_events)
+
+    first = service.search(date(2026, 9, 12), "BUE", "PMI", timetable)
+    second = service.search(date(2026, 9, 12), "BUE", "PMI", timetable)
+
+    assert first[0].path[0] is second[0].path[0]
+    assert first[0].path[1] is second[0].path[1]
+
+
+def test_search_with_longest_allowed_duration_loads_bounded_span() -> None:
+    loader = _RecordingLoader()
+    timetable = PartitionedTimetable(loader)
+    rules = ConnectionRules(
+        max_connection_minutes=MAX_RULE_MINUTES,
+        max_journey_duration_minutes=MAX_RULE_MINUTES,
+    )
+
+    JourneySearchService().search(
+        date(2026, 9, 12), "BUE", "PMI", timetable, rules=rules
+    )
+
+    assert timetable.loaded_dates == [
+        date(2026, 9, 12) + timedelta(days=n) for n in range(4)
+    ]